@@ -110,6 +110,30 @@ class Ui_MainWindow(object):
         self.saveQueryButton.setSizePolicy(sizePolicy)
         self.saveQueryButton.setObjectName("saveQueryButton")
         self.horizontalLayout_5.addWidget(self.saveQueryButton)
+        self.newTabButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.newTabButton.sizePolicy().hasHeightForWidth())
+        self.newTabButton.setSizePolicy(sizePolicy)
+        self.newTabButton.setObjectName("newTabButton")
+        self.horizontalLayout_5.addWidget(self.newTabButton)
+        self.libraryButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.libraryButton.sizePolicy().hasHeightForWidth())
+        self.libraryButton.setSizePolicy(sizePolicy)
+        self.libraryButton.setObjectName("libraryButton")
+        self.horizontalLayout_5.addWidget(self.libraryButton)
+        self.viewsButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.viewsButton.sizePolicy().hasHeightForWidth())
+        self.viewsButton.setSizePolicy(sizePolicy)
+        self.viewsButton.setObjectName("viewsButton")
+        self.horizontalLayout_5.addWidget(self.viewsButton)
         spacerItem = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
         self.horizontalLayout_5.addItem(spacerItem)
         self.verticalLayout.addLayout(self.horizontalLayout_5)
@@ -117,9 +141,20 @@ class Ui_MainWindow(object):
         self.horizontalLayout_7.setSizeConstraint(QtWidgets.QLayout.SizeConstraint.SetNoConstraint)
         self.horizontalLayout_7.setSpacing(0)
         self.horizontalLayout_7.setObjectName("horizontalLayout_7")
-        self.queryInput = QtWidgets.QPlainTextEdit(parent=self.centralwidget)
+        self.queryTabWidget = QtWidgets.QTabWidget(parent=self.centralwidget)
+        self.queryTabWidget.setTabsClosable(True)
+        self.queryTabWidget.setMovable(True)
+        self.queryTabWidget.setObjectName("queryTabWidget")
+        self.queryTab = QtWidgets.QWidget()
+        self.queryTab.setObjectName("queryTab")
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.queryTab)
+        self.horizontalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.queryInput = QtWidgets.QPlainTextEdit(parent=self.queryTab)
         self.queryInput.setObjectName("queryInput")
-        self.horizontalLayout_7.addWidget(self.queryInput)
+        self.horizontalLayout_8.addWidget(self.queryInput)
+        self.queryTabWidget.addTab(self.queryTab, "")
+        self.horizontalLayout_7.addWidget(self.queryTabWidget)
         self.verticalLayout.addLayout(self.horizontalLayout_7)
         self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_6.setSizeConstraint(QtWidgets.QLayout.SizeConstraint.SetNoConstraint)
@@ -132,6 +167,14 @@ class Ui_MainWindow(object):
         self.executeButton.setSizePolicy(sizePolicy)
         self.executeButton.setObjectName("executeButton")
         self.horizontalLayout_6.addWidget(self.executeButton)
+        self.previewButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.previewButton.sizePolicy().hasHeightForWidth())
+        self.previewButton.setSizePolicy(sizePolicy)
+        self.previewButton.setObjectName("previewButton")
+        self.horizontalLayout_6.addWidget(self.previewButton)
         self.cancelButton = QtWidgets.QPushButton(parent=self.centralwidget)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
         sizePolicy.setHorizontalStretch(0)
@@ -140,6 +183,14 @@ class Ui_MainWindow(object):
         self.cancelButton.setSizePolicy(sizePolicy)
         self.cancelButton.setObjectName("cancelButton")
         self.horizontalLayout_6.addWidget(self.cancelButton)
+        self.queueButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.queueButton.sizePolicy().hasHeightForWidth())
+        self.queueButton.setSizePolicy(sizePolicy)
+        self.queueButton.setObjectName("queueButton")
+        self.horizontalLayout_6.addWidget(self.queueButton)
         spacerItem1 = QtWidgets.QSpacerItem(340, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
         self.horizontalLayout_6.addItem(spacerItem1)
         self.verticalLayout.addLayout(self.horizontalLayout_6)
@@ -192,6 +243,7 @@ class Ui_MainWindow(object):
         self.menubar.addAction(self.menuFile.menuAction())
 
         self.retranslateUi(MainWindow)
+        self.queryTabWidget.setCurrentIndex(0)
         self.actionExit.triggered.connect(MainWindow.close) # type: ignore
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
 
@@ -203,8 +255,14 @@ class Ui_MainWindow(object):
         self.outputButton.setText(_translate("MainWindow", " Select Output File "))
         self.loadQueryButton.setText(_translate("MainWindow", " Load SQL Query "))
         self.saveQueryButton.setText(_translate("MainWindow", " Save SQL Query "))
+        self.newTabButton.setText(_translate("MainWindow", " New Query Tab "))
+        self.libraryButton.setText(_translate("MainWindow", " Saved Queries "))
+        self.viewsButton.setText(_translate("MainWindow", " Materialized Views "))
+        self.queryTabWidget.setTabText(self.queryTabWidget.indexOf(self.queryTab), _translate("MainWindow", "Query 1"))
         self.executeButton.setText(_translate("MainWindow", " Execute Query "))
+        self.previewButton.setText(_translate("MainWindow", " Preview Query "))
         self.cancelButton.setText(_translate("MainWindow", " Cancel Query "))
+        self.queueButton.setText(_translate("MainWindow", " Query Queue "))
         self.showTableButton.setText(_translate("MainWindow", " v "))
         self.fullscreenTableButton.setText(_translate("MainWindow", " Fullscreen "))
         self.menuFile.setTitle(_translate("MainWindow", "File"))
@@ -7,3 +7,7 @@ set "VENV_PATH=%PROJECT_DIR%\.venv\Scripts\pyuic6.exe"
 :: Run pyuic6 with the provided arguments
 %VENV_PATH% Excel_SQL_GUI.ui -o GUI.py
 %VENV_PATH% settings.ui -o settings.py
+%VENV_PATH% jobqueue.ui -o jobqueue.py
+%VENV_PATH% library.ui -o library.py
+%VENV_PATH% parameters.ui -o parameters.py
+%VENV_PATH% views.ui -o views.py
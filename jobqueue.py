@@ -0,0 +1,72 @@
+# Form implementation generated from reading ui file 'jobqueue.ui'
+#
+# Created by: PyQt6 UI code generator 6.8.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_QueueWindow(object):
+    def setupUi(self, QueueWindow):
+        QueueWindow.setObjectName("QueueWindow")
+        QueueWindow.resize(560, 300)
+        self.verticalLayout = QtWidgets.QVBoxLayout(QueueWindow)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.jobTable = QtWidgets.QTableWidget(parent=QueueWindow)
+        self.jobTable.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.jobTable.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.jobTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.jobTable.setObjectName("jobTable")
+        self.jobTable.setColumnCount(4)
+        self.jobTable.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.jobTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.jobTable.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.jobTable.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.jobTable.setHorizontalHeaderItem(3, item)
+        self.jobTable.horizontalHeader().setStretchLastSection(True)
+        self.jobTable.verticalHeader().setVisible(False)
+        self.verticalLayout.addWidget(self.jobTable)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.priorityUpButton = QtWidgets.QPushButton(parent=QueueWindow)
+        self.priorityUpButton.setObjectName("priorityUpButton")
+        self.horizontalLayout.addWidget(self.priorityUpButton)
+        self.priorityDownButton = QtWidgets.QPushButton(parent=QueueWindow)
+        self.priorityDownButton.setObjectName("priorityDownButton")
+        self.horizontalLayout.addWidget(self.priorityDownButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.cancelJobButton = QtWidgets.QPushButton(parent=QueueWindow)
+        self.cancelJobButton.setObjectName("cancelJobButton")
+        self.horizontalLayout.addWidget(self.cancelJobButton)
+        self.closeButton = QtWidgets.QPushButton(parent=QueueWindow)
+        self.closeButton.setObjectName("closeButton")
+        self.horizontalLayout.addWidget(self.closeButton)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(QueueWindow)
+        self.closeButton.clicked.connect(QueueWindow.close) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(QueueWindow)
+
+    def retranslateUi(self, QueueWindow):
+        _translate = QtCore.QCoreApplication.translate
+        QueueWindow.setWindowTitle(_translate("QueueWindow", "Form"))
+        item = self.jobTable.horizontalHeaderItem(0)
+        item.setText(_translate("QueueWindow", "Tab"))
+        item = self.jobTable.horizontalHeaderItem(1)
+        item.setText(_translate("QueueWindow", "Status"))
+        item = self.jobTable.horizontalHeaderItem(2)
+        item.setText(_translate("QueueWindow", "Priority"))
+        item = self.jobTable.horizontalHeaderItem(3)
+        item.setText(_translate("QueueWindow", "Query"))
+        self.priorityUpButton.setText(_translate("QueueWindow", " Raise Priority "))
+        self.priorityDownButton.setText(_translate("QueueWindow", " Lower Priority "))
+        self.cancelJobButton.setText(_translate("QueueWindow", " Cancel Job "))
+        self.closeButton.setText(_translate("QueueWindow", " Close "))
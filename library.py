@@ -0,0 +1,56 @@
+# Form implementation generated from reading ui file 'library.ui'
+#
+# Created by: PyQt6 UI code generator 6.8.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_LibraryWindow(object):
+    def setupUi(self, LibraryWindow):
+        LibraryWindow.setObjectName("LibraryWindow")
+        LibraryWindow.resize(600, 360)
+        self.verticalLayout = QtWidgets.QVBoxLayout(LibraryWindow)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.queryList = QtWidgets.QListWidget(parent=LibraryWindow)
+        self.queryList.setObjectName("queryList")
+        self.horizontalLayout_2.addWidget(self.queryList)
+        self.queryPreview = QtWidgets.QPlainTextEdit(parent=LibraryWindow)
+        self.queryPreview.setReadOnly(True)
+        self.queryPreview.setObjectName("queryPreview")
+        self.horizontalLayout_2.addWidget(self.queryPreview)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.saveCurrentButton = QtWidgets.QPushButton(parent=LibraryWindow)
+        self.saveCurrentButton.setObjectName("saveCurrentButton")
+        self.horizontalLayout.addWidget(self.saveCurrentButton)
+        self.deleteButton = QtWidgets.QPushButton(parent=LibraryWindow)
+        self.deleteButton.setObjectName("deleteButton")
+        self.horizontalLayout.addWidget(self.deleteButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.openButton = QtWidgets.QPushButton(parent=LibraryWindow)
+        self.openButton.setObjectName("openButton")
+        self.horizontalLayout.addWidget(self.openButton)
+        self.closeButton = QtWidgets.QPushButton(parent=LibraryWindow)
+        self.closeButton.setObjectName("closeButton")
+        self.horizontalLayout.addWidget(self.closeButton)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(LibraryWindow)
+        self.closeButton.clicked.connect(LibraryWindow.close) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(LibraryWindow)
+
+    def retranslateUi(self, LibraryWindow):
+        _translate = QtCore.QCoreApplication.translate
+        LibraryWindow.setWindowTitle(_translate("LibraryWindow", "Form"))
+        self.saveCurrentButton.setText(_translate("LibraryWindow", " Save Current Query "))
+        self.deleteButton.setText(_translate("LibraryWindow", " Delete "))
+        self.openButton.setText(_translate("LibraryWindow", " Open in New Tab "))
+        self.closeButton.setText(_translate("LibraryWindow", " Close "))
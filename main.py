@@ -3,29 +3,64 @@ import os.path
 import subprocess
 import time
 import sqlite3
+import datetime
+import uuid
+import tempfile
+import pathlib
+import importlib
+import threading
+import weakref
+import hashlib
+import json
+import re
+import multiprocessing
+from functools import partial
 
 import PyQt6
-from PyQt6 import QtGui
-from PyQt6.QtCore import QThread, pyqtSignal, QTimer, QSize, QSettings, QCoreApplication, QAbstractTableModel, Qt
-from PyQt6.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox, QPushButton, QDialog
-from PyQt6.uic.Compiler.qtproxies import QtWidgets
-import pandas as pd
-import openpyxl
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from PyQt6 import QtGui, QtWidgets
+from PyQt6.QtCore import QThread, pyqtSignal, QTimer, QSize, QSettings, QCoreApplication, QAbstractTableModel, Qt, \
+    QStandardPaths
+from PyQt6.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox, QPushButton, QDialog, QProgressBar, \
+    QWidget, QHBoxLayout, QPlainTextEdit, QTableWidgetItem, QSplashScreen, QLineEdit, QInputDialog
 
 from GUI import Ui_MainWindow
 from settings import Ui_SettingsWindow
+from jobqueue import Ui_QueueWindow
+from library import Ui_LibraryWindow
+from parameters import Ui_ParameterWindow
+from views import Ui_ViewsWindow
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access, so heavy libraries don't slow down startup"""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+# pandas and openpyxl take most of the startup time, they are imported when first used or by warm_up_imports()
+pd = LazyModule("pandas")
+
+def warm_up_imports():
+    """Imports the deferred libraries, run in a background thread once the window is shown"""
+    # Plain import statements so PyInstaller still bundles them
+    import pandas
+    import openpyxl
+    from openpyxl.worksheet import table
 
 class OutputTableModel(QAbstractTableModel):
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data=None):
         super().__init__()
-        self._data = data
+        self._data = data # pandas DataFrame, None until the first result so pandas isn't needed at startup
 
     def rowCount(self, parent=None):
-        return self._data.shape[0]
+        return 0 if self._data is None else self._data.shape[0]
 
     def columnCount(self, parent=None):
-        return self._data.shape[1]
+        return 0 if self._data is None else self._data.shape[1]
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if not index.isValid():
@@ -52,11 +87,611 @@ class OutputTableModel(QAbstractTableModel):
         Sort the data in the model by a given column and order.
         This method is triggered when the user clicks on the column header.
         """
+        if self._data is None:
+            return
+
         # Sort the DataFrame based on the column
         self.beginResetModel()  # Tell the model that it will be reset
         self._data = self._data.sort_values(self._data.columns[column], ascending=(order != Qt.SortOrder.AscendingOrder))
         self.endResetModel()  # Notify the model that the reset is complete
 
+class ProgressReporter:
+    """
+    Tracks progress of a long-running step and emits throttled updates with throughput and ETA.
+    update() is cheap enough to call from hot loops, a signal is only emitted every `interval` seconds.
+    """
+    def __init__(self, signal, stage, total, unit="rows", interval=0.25):
+        self.signal = signal
+        self.stage = stage
+        self.total = total
+        self.unit = unit
+        self.interval = interval
+        self.done = 0
+        self.start_time = time.monotonic()
+        self.last_emit = 0.0
+
+    def update(self, done, stage=None):
+        """Sets the absolute progress and emits if the throttle interval has passed"""
+        self.done = done
+        if stage is not None:
+            self.stage = stage
+        now = time.monotonic()
+        if now - self.last_emit >= self.interval:
+            self.last_emit = now
+            self.emit(now)
+
+    def set_stage(self, stage):
+        """Changes the stage and emits immediately"""
+        self.stage = stage
+        self.emit(time.monotonic())
+
+    def advance(self, n=1, stage=None):
+        """Adds n to the progress"""
+        self.update(self.done + n, stage)
+
+    def busy(self, stage, eta=None):
+        """Starts a stage whose progress can't be measured, the progress bar is set to busy meanwhile"""
+        self.stage = stage
+        msg = f"{stage}: {self.done:,}/{self.total:,} {self.unit}"
+        if eta is not None:
+            msg += f" (ETA {format_duration(eta)})"
+        self.signal.emit(msg, 0, 0)
+
+    def emit(self, now):
+        """Formats and emits the current progress"""
+        elapsed = now - self.start_time
+        msg = f"{self.stage}: {self.done:,}/{self.total:,} {self.unit}"
+        if elapsed > 0 and self.done > 0:
+            rate = self.done / elapsed
+            msg += f" ({rate:,.0f} {self.unit}/s"
+            if self.done < self.total:
+                msg += f", ETA {format_duration((self.total - self.done) / rate)}"
+            msg += ")"
+        self.signal.emit(msg, self.done, self.total)
+
+def format_duration(seconds):
+    """Formats seconds as m:ss or h:mm:ss"""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02}:{seconds:02}"
+    return f"{minutes}:{seconds:02}"
+
+def sheet_row_counts(xls):
+    """Returns the number of data rows per sheet from the workbook metadata without reading the cells, or None"""
+    try:
+        if hasattr(xls.book, "sheet_by_name"):  # xlrd (.xls)
+            return {sheet: max(xls.book.sheet_by_name(sheet).nrows - 1, 0) for sheet in xls.sheet_names}
+        return {sheet: max((xls.book[sheet].max_row or 1) - 1, 0) for sheet in xls.sheet_names}
+    except Exception:
+        return None
+
+class Workspace:
+    """
+    SQLite database holding the sheets of the loaded workbook.
+    The sheets are ingested once after loading, every query job then opens its own read-only connection.
+    On disk the database lives in a temp file that is memory-mapped, so workbooks larger than RAM can be queried.
+    Materialized views are stored as tables next to the sheets and rebuilt when a table they read from changes.
+    """
+    PAGE_SIZE = 16384
+    CACHE_SIZE_KIB = 256 * 1024
+    MMAP_SIZE = 1024 ** 3
+    STATEMENT_CACHE_SIZE = 256
+
+    def __init__(self, on_disk=False):
+        self.on_disk = on_disk
+        self.path = None
+        if on_disk:
+            fd, self.path = tempfile.mkstemp(prefix="excel_sql_", suffix=".sqlite")
+            os.close(fd)
+            self.uri = pathlib.Path(self.path).as_uri()
+        else:
+            self.uri = f"file:excel_sql_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+        # A shared in-memory database only lives as long as a connection to it is open
+        self.keeper = sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+        self.pool = [] # idle read-only connections
+        self.pool_lock = threading.Lock()
+        self.sheets = set() # lower-cased names of the ingested sheets
+        self.versions = {} # lower-cased table name -> how often it has been (re)built
+        self.views = {} # materialized views built in this workspace -> their query and the table versions they read
+        # Writing the schema of a shared in-memory database fails while another connection reads,
+        # so view builds wait for running reads and hold back new ones, see lock_exclusive()
+        self.gate = threading.Condition()
+        self.readers = 0 # pooled connections in use, only counted in memory
+        self.writers = 0 # view builds waiting for or holding exclusive access
+        self.writing = False
+        self.dropped = set() # lower-cased names of deleted views, their tables are dropped once nothing reads
+        if on_disk:
+            # page_size has to be set before the first table is created
+            self.keeper.execute(f"PRAGMA page_size = {self.PAGE_SIZE}")
+            self.keeper.execute("PRAGMA journal_mode = WAL")
+        # close() should be called once nothing uses the workspace, this also cleans up on GC and at exit
+        self.finalizer = weakref.finalize(self, Workspace.cleanup, self.keeper, self.pool, self.path)
+
+    def connect(self, read_only=True, check_same_thread=True):
+        """Opens a new connection to the workspace"""
+        conn = sqlite3.connect(self.uri, uri=True, check_same_thread=check_same_thread, cached_statements=self.STATEMENT_CACHE_SIZE)
+        if self.on_disk:
+            conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+            conn.execute(f"PRAGMA cache_size = -{self.CACHE_SIZE_KIB}")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def acquire(self, should_stop=None):
+        """
+        Takes an idle read-only connection from the pool or opens a new one.
+        Pooled connections keep their prepared statements, so re-running a query skips parsing and planning.
+        Returns None if should_stop() turns true while waiting for a view build.
+        """
+        if not self.on_disk:
+            with self.gate:
+                while self.writers:
+                    if should_stop is not None and should_stop():
+                        return None
+                    self.gate.wait(0.25)
+                self.readers += 1
+        with self.pool_lock:
+            if self.pool:
+                return self.pool.pop()
+        try:
+            return self.connect(check_same_thread=False)
+        except sqlite3.Error:
+            self.release(None)
+            raise
+
+    def release(self, conn):
+        """Returns a connection taken with acquire() to the pool"""
+        if conn is not None:
+            with self.pool_lock:
+                self.pool.append(conn)
+        if not self.on_disk:
+            with self.gate:
+                self.readers -= 1
+                self.gate.notify_all()
+
+    def lock_exclusive(self, should_stop=None):
+        """
+        Waits until no other query reads from the workspace and holds back new reads until unlock_exclusive().
+        Returns False without locking if should_stop() turns true while waiting.
+        """
+        with self.gate:
+            self.writers += 1
+            while self.readers or self.writing:
+                if should_stop is not None and should_stop():
+                    self.writers -= 1
+                    self.gate.notify_all()
+                    return False
+                self.gate.wait(0.25)
+            self.writing = True
+            return True
+
+    def try_lock_exclusive(self):
+        """Like lock_exclusive() but returns False right away if a query or view build is running"""
+        with self.gate:
+            if self.readers or self.writers:
+                return False
+            self.writers += 1
+            self.writing = True
+            return True
+
+    def unlock_exclusive(self):
+        """Lets waiting reads and view builds continue"""
+        with self.gate:
+            self.writing = False
+            self.writers -= 1
+            self.gate.notify_all()
+
+    def mark_loaded(self, table):
+        """Records that a sheet has been (re)ingested, views built from its previous contents become stale"""
+        key = str(table).lower()
+        self.sheets.add(key)
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def view_status(self, name, query):
+        """Returns 'built', 'stale' or 'not built' for a materialized view"""
+        view = self.views.get(name.lower())
+        if view is None:
+            return "not built"
+        if view["query"] != query or any(self.versions.get(table) != version for table, version in view["dependencies"].items()):
+            return "stale"
+        return "built"
+
+    def refresh_views(self, query, definitions, on_build=None, should_stop=None):
+        """
+        Builds the materialized views a query references that are missing or stale, views they build on first.
+        on_build(name) is called before each build, should_stop() can abort waiting for running queries.
+        Returns the names of the rebuilt views.
+        """
+        names = referenced_views(query, definitions)
+        if not self.dropped and all(self.view_status(name, definitions[name]) == "built" for name in names):
+            return []
+
+        rebuilt = []
+        if not self.lock_exclusive(should_stop):
+            return rebuilt
+        try:
+            self.drop_deleted_views()
+            # Checked again, another job may have built them while this one waited
+            for name in names:
+                if self.view_status(name, definitions[name]) != "built":
+                    if on_build is not None:
+                        on_build(name)
+                    try:
+                        self.materialize(name, definitions[name])
+                    except sqlite3.Error as e:
+                        raise sqlite3.OperationalError(f"Materialized view '{name}': {e}") from e
+                    rebuilt.append(name)
+        finally:
+            self.unlock_exclusive()
+        return rebuilt
+
+    def materialize(self, name, query):
+        """(Re)creates the table of a materialized view and records which tables it was built from"""
+        key = name.lower()
+        if key in self.sheets:
+            raise ValueError(f"Materialized view '{name}' has the same name as a sheet")
+
+        # The authorizer sees every table the query reads, views built on other views included
+        tables = set()
+        def authorizer(action, table, *_):
+            if action == sqlite3.SQLITE_READ and table and not table.startswith("sqlite_"):
+                tables.add(table.lower())
+            return sqlite3.SQLITE_OK
+
+        sql = query.strip().rstrip(";")
+        self.keeper.set_authorizer(authorizer)
+        try:
+            self.keeper.execute(f"DROP TABLE IF EXISTS {quote_identifier(name)}")
+            # The newline keeps a trailing -- comment from swallowing the rest of the statement
+            self.keeper.execute(f"CREATE TABLE {quote_identifier(name)} AS\n{sql}\n")
+            self.keeper.execute(f"ANALYZE {quote_identifier(name)}")
+            self.keeper.commit()
+        finally:
+            self.keeper.set_authorizer(None)
+
+        tables.discard(key)
+        self.versions[key] = self.versions.get(key, 0) + 1
+        if key in self.dropped:  # deleted while it was being built, the table is dropped with the others
+            return
+        self.views[key] = {"query": query, "dependencies": {table: self.versions.get(table) for table in tables}}
+
+    def invalidate(self, name):
+        """Marks a materialized view as stale, it's rebuilt the next time a query uses it"""
+        self.views.pop(name.lower(), None)
+
+    def drop_view(self, name):
+        """
+        Removes the table of a deleted materialized view. Doesn't wait for running queries,
+        if one is running the table is dropped before the next view build instead.
+        """
+        # Also when the view isn't registered, it may have been refreshed or still be building
+        self.views.pop(name.lower(), None)
+        self.dropped.add(name.lower())
+        if self.try_lock_exclusive():
+            try:
+                self.drop_deleted_views()
+            finally:
+                self.unlock_exclusive()
+
+    def drop_deleted_views(self):
+        """Drops the tables of deleted views, needs exclusive access"""
+        while self.dropped:
+            self.keeper.execute(f"DROP TABLE IF EXISTS {quote_identifier(self.dropped.pop())}")
+        self.keeper.commit()
+
+    def close(self):
+        """Closes the workspace and removes its temp files, no job may use it anymore"""
+        self.finalizer()
+
+    @staticmethod
+    def cleanup(keeper, pool, path):
+        """Closes the connections and removes the temp files of a workspace"""
+        for conn in pool:
+            conn.close()
+        pool.clear()
+        keeper.close()
+        if path:
+            for path in (path, f"{path}-wal", f"{path}-shm"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+class BulkLoader:
+    """
+    Fast path for ingesting sheets into the workspace.
+    Tables are created with explicit column types and filled column-wise through executemany in one transaction
+    per sheet, with journaling and syncing switched off during the load. Indexes are built once the data is in.
+    """
+    CHUNK_SIZE = 100_000
+    NATIVE_TYPES = (str, int, float, bytes, type(None))
+    # Same type mapping as DataFrame.to_sql uses for SQLite, so queries behave like before
+    SQL_TYPES = {"integer": "INTEGER", "floating": "REAL", "boolean": "INTEGER", "datetime64": "TIMESTAMP",
+                 "datetime": "TIMESTAMP", "date": "DATE", "time": "TIME", "timedelta64": "INTEGER"}
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+
+    def load(self, table, df, reporter=None, stage=None):
+        """Replaces table with the contents of df"""
+        name = quote_identifier(table)
+        self.conn.execute(f"DROP TABLE IF EXISTS {name}")
+        if not len(df.columns):  # empty sheet, SQLite can't create a table without columns
+            return
+        columns = ", ".join(f"{quote_identifier(column)} {self.sql_type(df[column])}" for column in df.columns)
+        self.conn.execute(f"CREATE TABLE {name} ({columns})")
+        if df.empty:
+            return
+
+        insert = f"INSERT INTO {name} VALUES ({', '.join('?' * len(df.columns))})"
+        for start in range(0, len(df), self.CHUNK_SIZE):
+            chunk = df.iloc[start:start + self.CHUNK_SIZE]
+            self.conn.executemany(insert, zip(*(self.column_values(chunk[column]) for column in chunk.columns)))
+            if reporter is not None:
+                reporter.advance(len(chunk), stage)
+        self.conn.commit()
+
+    def create_indexes(self, table, columns):
+        """Indexes the given columns of a loaded table"""
+        for column in columns:
+            index = quote_identifier(f"idx_{table}_{column}")
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {quote_identifier(table)} ({quote_identifier(column)})")
+        self.conn.commit()
+
+    def close(self):
+        """Gathers planner statistics and restores journaling and syncing"""
+        self.conn.execute("PRAGMA analysis_limit = 1000")
+        self.conn.execute("ANALYZE")
+        self.conn.commit()
+        self.conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        self.conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+
+    @classmethod
+    def sql_type(cls, series):
+        """Returns the SQLite column type for a Series"""
+        return cls.SQL_TYPES.get(pd.api.types.infer_dtype(series, skipna=True), "TEXT")
+
+    @classmethod
+    def column_values(cls, series):
+        """Converts a Series to a list of values SQLite can bind, NaN is stored as NULL by SQLite itself"""
+        kind = series.dtype.kind
+        if kind in "iubf":
+            return series.tolist()
+        if kind == "M" and series.dt.tz is None:
+            # Microseconds only where a value has them, like datetime.isoformat(" ") which to_sql uses
+            values = series.dt.strftime("%Y-%m-%d %H:%M:%S")
+            whole = series.dt.microsecond == 0
+            if not whole.all():
+                values = values.where(whole, series.dt.strftime("%Y-%m-%d %H:%M:%S.%f"))
+            return values.astype(object).where(series.notna(), None).tolist()
+        if kind == "m":
+            # Integers in the unit of the column like to_sql, except that NaT is stored as NULL
+            values = pd.Series(series.to_numpy().view("i8"), index=series.index).astype(object)
+            return values.where(series.notna(), None).tolist()
+        return [value if type(value) in cls.NATIVE_TYPES else cls.adapt(value) for value in series.astype(object).tolist()]
+
+    @staticmethod
+    def adapt(value):
+        """Converts a single value of an object column like DataFrame.to_sql would"""
+        if pd.isna(value):
+            return None
+        if isinstance(value, datetime.datetime):
+            return value.isoformat(" ")
+        if isinstance(value, datetime.date):
+            return value.isoformat()
+        if isinstance(value, datetime.time):
+            return value.strftime("%H:%M:%S.%f")
+        if isinstance(value, (int, float, str)):  # numpy scalars and subclasses
+            return value
+        return str(value)
+
+def quote_identifier(name):
+    """Quotes a table or column name for SQLite"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+def is_key_column(name):
+    """Guesses whether a column is a join key from its name (id, customer_id, CustomerID, customerId)"""
+    name = str(name).strip()
+    lower = name.lower()
+    return lower == "id" or lower.endswith(("_id", " id")) or name.endswith("ID") or (name.endswith("Id") and name[:-2][-1:].islower())
+
+def profile_sheet(df):
+    """Computes per-column statistics of a sheet, vectorised per column"""
+    return {"rows": len(df), "columns": {str(column): profile_column(df[column]) for column in df.columns}}
+
+def profile_column(series):
+    """Returns dtype, null count, distinct count, min/max and the most common values of a column"""
+    counts = series.value_counts(dropna=True)
+    profile = {
+        "dtype": str(series.dtype),
+        "nulls": int(series.isna().sum()),
+        "distinct": len(counts),
+        "min": None,
+        "max": None,
+        "top": [[str(value), int(count)] for value, count in counts.head(3).items()],
+    }
+    if len(counts):
+        try:
+            profile["min"], profile["max"] = str(counts.index.min()), str(counts.index.max())
+        except TypeError:  # mixed types can't be compared
+            pass
+    return profile
+
+def format_column_profile(profile, rows):
+    """Formats a column profile for a tooltip"""
+    def shorten(value):
+        return value if len(value) <= 40 else value[:37] + "..."
+
+    nulls = f"{profile['nulls']:,}" + (f" ({profile['nulls'] / rows:.1%})" if rows else "")
+    lines = [f"Type: {profile['dtype']}", f"Nulls: {nulls}", f"Distinct: {profile['distinct']:,}"]
+    if profile["min"] is not None:
+        lines += [f"Min: {shorten(profile['min'])}", f"Max: {shorten(profile['max'])}"]
+    if profile["top"] and profile["top"][0][1] > 1:  # all values unique, nothing worth showing
+        lines.append("Top: " + ", ".join(f"{shorten(value)} ({count:,})" for value, count in profile["top"]))
+    return "\n".join(lines)
+
+def index_columns(sheet_profile):
+    """Picks the columns worth indexing: key-like names that are selective enough to help lookups and joins"""
+    rows = sheet_profile["rows"]
+    return [column for column, profile in sheet_profile["columns"].items()
+            if is_key_column(column) and profile["distinct"] > 1 and profile["distinct"] >= rows * 0.01]
+
+def workbook_fingerprint(path):
+    """Identifies a version of a workbook by its path, size and modification time"""
+    stat = os.stat(path)
+    return hashlib.sha1(f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}".encode()).hexdigest()
+
+def profile_cache_path(fingerprint):
+    """Returns the cache file of a workbook version"""
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation), "profiles", f"{fingerprint}.json")
+
+def load_cached_profiles(fingerprint):
+    """Returns the cached column profiles of a workbook version or None"""
+    try:
+        with open(profile_cache_path(fingerprint), 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_profiles(fingerprint, profiles):
+    """Caches column profiles, failing to write the cache is not an error"""
+    path = profile_cache_path(fingerprint)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            json.dump(profiles, file)
+    except OSError:
+        pass
+
+# Named :param placeholders, string literals, quoted identifiers and comments are matched so they can be skipped
+PARAMETER_PATTERN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|(?<![:\w]):([A-Za-z_]\w*)", re.S)
+
+def query_parameters(query):
+    """Returns the names of the :param placeholders of a query in order of appearance"""
+    names = [match.group(1) for match in PARAMETER_PATTERN.finditer(query) if match.group(1)]
+    return list(dict.fromkeys(names))
+
+# Plain decimal numbers only, codes like 00123 and words like nan or Infinity stay text
+NUMBER_PATTERN = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?")
+
+def parse_parameter(text):
+    """Binds numbers as numbers so they compare like the sheet values, everything else as text"""
+    match = NUMBER_PATTERN.fullmatch(text.strip())
+    if match is None:
+        return text
+    return float(match.group(0)) if match.group(1) else int(match.group(0))
+
+# Identifiers, quoted ones included, and brackets, commas and dots. String literals and comments are matched so they can be skipped
+TABLE_TOKEN_PATTERN = re.compile(r"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/|\"((?:[^\"]|\"\")*)\"|\[([^\]]*)\]|`([^`]*)`|([A-Za-z_]\w*)|([(),.])", re.S)
+# Keywords that end the table list of a FROM clause
+CLAUSE_KEYWORDS = {"select", "where", "group", "having", "order", "limit", "window", "union", "except", "intersect", "values"}
+
+def query_tables(query):
+    """Returns the lower-cased names a query reads from, the ones after FROM, JOIN or a comma in a FROM clause"""
+    tokens = [] # (token, bare), only bare tokens can be keywords or punctuation
+    for match in TABLE_TOKEN_PATTERN.finditer(query):
+        quoted = next((group for group in match.groups()[:3] if group is not None), None)
+        if quoted is not None:
+            tokens.append((quoted.replace('""', '"').lower(), False))
+        elif match.group(4) or match.group(5):
+            tokens.append(((match.group(4) or match.group(5)).lower(), True))
+
+    def is_cte(i):
+        """Whether the identifier at i is named by WITH, as in "name AS (" or "name (columns) AS (" """
+        j = i + 1
+        if tokens[j:j + 1] == [("(", True)]:
+            depth = 0
+            for j in range(i + 1, len(tokens)):
+                depth += {"(": 1, ")": -1}.get(tokens[j][0], 0) if tokens[j][1] else 0
+                if depth == 0:
+                    break
+            j += 1
+        return tokens[j:j + 2] == [("as", True), ("(", True)]
+
+    tables, ctes = set(), set()
+    clauses = [None] # clause of each bracket depth
+    expect_table = False
+    for i, (token, bare) in enumerate(tokens):
+        if bare and token == "(":
+            clauses.append(None)
+            expect_table = False
+        elif bare and token == ")":
+            if len(clauses) > 1:
+                clauses.pop()
+        elif bare and token == ",":
+            expect_table = clauses[-1] == "from"
+        elif bare and token in ("from", "join"):
+            clauses[-1] = "from"
+            expect_table = True
+        elif bare and token in CLAUSE_KEYWORDS:
+            clauses[-1] = token
+            expect_table = False
+        elif bare and token == ".":
+            continue
+        elif is_cte(i):
+            ctes.add(token)
+        elif expect_table and tokens[i + 1:i + 2] != [(".", True)]:  # schema.table, the table comes next
+            tables.add(token)
+            expect_table = False
+    return tables - ctes
+
+def referenced_views(query, definitions):
+    """Returns the materialized views a query uses, views they build on come before the views using them"""
+    views = {name.lower(): name for name in definitions}
+    order = []
+
+    def visit(key, path):
+        if key in order:
+            return
+        if key in path:
+            raise ValueError(f"Materialized view '{views[key]}' references itself")
+        for used in sorted(query_tables(definitions[views[key]]) & views.keys()):
+            visit(used, path | {key})
+        order.append(key)
+
+    for key in sorted(query_tables(query) & views.keys()):
+        visit(key, set())
+    return [views[key] for key in order]
+
+class QueryTab:
+    """Editor and result model of a single query tab"""
+    def __init__(self, page, editor):
+        self.page = page
+        self.editor = editor
+        self.table_model = OutputTableModel()
+        self.job = None
+        self.parameters = {} # last values entered for the query's :params
+
+class QueryJob:
+    """A query waiting for or running on an ExecuteQueryThread"""
+    next_id = 1
+
+    def __init__(self, tab, tab_name, query, output_file, workspace, preview_rows=None, parameters=None, partition=None, views=None):
+        self.id = QueryJob.next_id
+        QueryJob.next_id += 1
+        self.tab = tab
+        self.tab_name = tab_name
+        self.query = query
+        self.output_file = output_file
+        self.workspace = workspace
+        self.preview_rows = preview_rows # only fetch this many rows and skip writing the output file
+        self.parameters = parameters # values bound to the query's :params
+        self.partition = partition # partitioned export options, None writes a single file
+        self.views = views # materialized view definitions the query can use
+        self.priority = 0
+        self.status = "Queued"
+        self.thread = None
+        self.elapsed = 0
+        self.timer_msg = ""
+        self.progress = None # last (msg, done, total) reported by the thread
+
 class SettingsWindow(QDialog, Ui_SettingsWindow):
     def __init__(self):
         super().__init__()
@@ -80,6 +715,13 @@ class SettingsWindow(QDialog, Ui_SettingsWindow):
         self.experimentalFeaturesCheckBox.setChecked(self.settings.value('experimentalFeatures', False, type=bool))
         self.showOutputTableCheckBox.setChecked(self.settings.value('showOutputTable', False, type=bool))
         self.hideSuccessCheckBox.setChecked(self.settings.value('hideSuccess', False, type=bool))
+        self.maxConcurrentQueriesSpinBox.setValue(self.settings.value('maxConcurrentQueries', 2, type=int))
+        self.previewRowsSpinBox.setValue(self.settings.value('previewRows', 500, type=int))
+        self.onDiskWorkspaceCheckBox.setChecked(self.settings.value('onDiskWorkspace', False, type=bool))
+        self.partitionedExportCheckBox.setChecked(self.settings.value('partitionedExport', False, type=bool))
+        self.partitionCountSpinBox.setValue(self.settings.value('partitionCount', 4, type=int))
+        self.partitionColumnInput.setText(self.settings.value('partitionColumn', '', type=str))
+        self.partitionFormatComboBox.setCurrentText(self.settings.value('partitionFormat', 'xlsx', type=str))
 
         self.applyButton.clicked.connect(self.apply_settings)
 
@@ -87,63 +729,438 @@ class SettingsWindow(QDialog, Ui_SettingsWindow):
         self.settings.setValue('experimentalFeatures', self.experimentalFeaturesCheckBox.isChecked())
         self.settings.setValue('showOutputTable', self.showOutputTableCheckBox.isChecked())
         self.settings.setValue('hideSuccess', self.hideSuccessCheckBox.isChecked())
+        self.settings.setValue('maxConcurrentQueries', self.maxConcurrentQueriesSpinBox.value())
+        self.settings.setValue('previewRows', self.previewRowsSpinBox.value())
+        self.settings.setValue('onDiskWorkspace', self.onDiskWorkspaceCheckBox.isChecked())
+        self.settings.setValue('partitionedExport', self.partitionedExportCheckBox.isChecked())
+        self.settings.setValue('partitionCount', self.partitionCountSpinBox.value())
+        self.settings.setValue('partitionColumn', self.partitionColumnInput.text().strip())
+        self.settings.setValue('partitionFormat', self.partitionFormatComboBox.currentText())
         self.accept()
 
+class QueueWindow(QDialog, Ui_QueueWindow):
+    """Lists queued and running queries and lets the user cancel or reprioritise them"""
+    cancel_job = pyqtSignal(int)
+    change_priority = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+
+        self.setWindowTitle('Query Queue')
+        self.setWindowIcon(QtGui.QIcon(QtGui.QPixmap(icon_path)))
+
+        self.job_ids = []
+
+        self.cancelJobButton.clicked.connect(self.cancel_selected)
+        self.priorityUpButton.clicked.connect(lambda: self.change_selected_priority(1))
+        self.priorityDownButton.clicked.connect(lambda: self.change_selected_priority(-1))
+
+    def refresh(self, jobs):
+        """Repopulates the table with the given jobs, keeping the selection"""
+        selected = self.selected_job_id()
+        self.job_ids = [job.id for job in jobs]
+        self.jobTable.setRowCount(len(jobs))
+        for row, job in enumerate(jobs):
+            status = job.status
+            if job.progress is not None:
+                status = f"{status} - {job.progress[0]}"
+            elif job.thread is not None:
+                status = f"{status} ({job.elapsed}s)"
+            query = " ".join(job.query.split())
+            for column, value in enumerate((job.tab_name, status, str(job.priority), query)):
+                self.jobTable.setItem(row, column, QTableWidgetItem(value))
+        if selected in self.job_ids:
+            self.jobTable.selectRow(self.job_ids.index(selected))
+
+    def selected_job_id(self):
+        """Returns the id of the selected job or None"""
+        rows = self.jobTable.selectionModel().selectedRows()
+        if not rows or rows[0].row() >= len(self.job_ids):
+            return None
+        return self.job_ids[rows[0].row()]
+
+    def cancel_selected(self):
+        """Requests cancellation of the selected job"""
+        job_id = self.selected_job_id()
+        if job_id is not None:
+            self.cancel_job.emit(job_id)
+
+    def change_selected_priority(self, delta):
+        """Requests a priority change of the selected job"""
+        job_id = self.selected_job_id()
+        if job_id is not None:
+            self.change_priority.emit(job_id, delta)
+
+class LibraryWindow(QDialog, Ui_LibraryWindow):
+    """Library of named queries stored in the settings"""
+    def __init__(self, current_query, current_parameters, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+
+        self.setWindowTitle('Saved Queries')
+        self.setWindowIcon(QtGui.QIcon(QtGui.QPixmap(icon_path)))
+
+        self.settings = QSettings('Manyullyn17', 'Excel_SQL')
+        self.queries = json.loads(self.settings.value('savedQueries', '{}'))
+        self.current_query = current_query
+        self.current_parameters = current_parameters
+        self.selected = None # name of the query to open once the dialog is accepted
+
+        self.refresh()
+
+        self.queryList.currentTextChanged.connect(self.on_query_select)
+        self.queryList.itemDoubleClicked.connect(self.open_selected)
+        self.saveCurrentButton.clicked.connect(self.save_current)
+        self.deleteButton.clicked.connect(self.delete_selected)
+        self.openButton.clicked.connect(self.open_selected)
+
+    def refresh(self):
+        """Repopulates the query list"""
+        self.queryList.clear()
+        for name in sorted(self.queries, key=str.lower):
+            self.queryList.addItem(name)
+
+    def on_query_select(self, name):
+        """Shows the selected query and its parameters"""
+        if name not in self.queries:
+            self.queryPreview.clear()
+            return
+        text = self.queries[name]["query"]
+        parameters = query_parameters(text)
+        if parameters:
+            text += "\n\n-- Parameters: " + ", ".join(f":{parameter}" for parameter in parameters)
+        self.queryPreview.setPlainText(text)
+
+    def save_current(self):
+        """Saves the query of the current tab under a name"""
+        if not self.current_query:
+            QMessageBox.critical(self, "No Query", "Please write a query before saving.")
+            return
+
+        name, ok = QInputDialog.getText(self, "Save Query", "Name:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        if name in self.queries and QMessageBox.question(self, "Overwrite", f"Replace the saved query '{name}'?") != QMessageBox.StandardButton.Yes:
+            return
+
+        parameters = query_parameters(self.current_query)
+        self.queries[name] = {"query": self.current_query, "parameters": {key: value for key, value in self.current_parameters.items() if key in parameters}}
+        self.store()
+        self.refresh()
+
+    def delete_selected(self):
+        """Deletes the selected query from the library"""
+        name = self.queryList.currentItem().text() if self.queryList.currentItem() else None
+        if name in self.queries:
+            del self.queries[name]
+            self.store()
+            self.refresh()
+
+    def open_selected(self):
+        """Closes the dialog and lets the main window open the selected query"""
+        if self.queryList.currentItem() is not None:
+            self.selected = self.queryList.currentItem().text()
+            self.accept()
+
+    def store(self):
+        """Writes the library to the settings"""
+        self.settings.setValue('savedQueries', json.dumps(self.queries))
+
+class ParameterWindow(QDialog, Ui_ParameterWindow):
+    """Form for the values of a query's :param placeholders"""
+    def __init__(self, names, values, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+
+        self.setWindowTitle('Query Parameters')
+        self.setWindowIcon(QtGui.QIcon(QtGui.QPixmap(icon_path)))
+
+        self.inputs = {}
+        for name in names:
+            line_edit = QLineEdit(values.get(name, ""))
+            self.parameterForm.addRow(f":{name}", line_edit)
+            self.inputs[name] = line_edit
+
+    def values(self):
+        """Returns the entered values as text"""
+        return {name: line_edit.text() for name, line_edit in self.inputs.items()}
+
+class ViewsWindow(QDialog, Ui_ViewsWindow):
+    """Materialized views stored in the settings, queries can use them like sheets"""
+    def __init__(self, current_query, workspace, sheets, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+
+        self.setWindowTitle('Materialized Views')
+        self.setWindowIcon(QtGui.QIcon(QtGui.QPixmap(icon_path)))
+
+        self.settings = QSettings('Manyullyn17', 'Excel_SQL')
+        self.views = json.loads(self.settings.value('materializedViews', '{}'))
+        self.current_query = current_query
+        self.workspace = workspace
+        self.sheets = {str(sheet).lower() for sheet in sheets}
+
+        self.refresh()
+
+        self.viewList.currentTextChanged.connect(self.on_view_select)
+        self.materializeCurrentButton.clicked.connect(self.materialize_current)
+        self.refreshButton.clicked.connect(self.refresh_selected)
+        self.deleteButton.clicked.connect(self.delete_selected)
+
+    def status(self, name):
+        """Returns whether the view is built in the current workspace"""
+        return self.workspace.view_status(name, self.views[name]) if self.workspace is not None else "not built"
+
+    def refresh(self):
+        """Repopulates the view list"""
+        self.viewList.clear()
+        for name in sorted(self.views, key=str.lower):
+            self.viewList.addItem(name)
+            self.viewList.item(self.viewList.count() - 1).setToolTip(self.status(name).capitalize())
+
+    def on_view_select(self, name):
+        """Shows the selected view's query and status"""
+        if name not in self.views:
+            self.viewPreview.clear()
+            return
+        self.viewPreview.setPlainText(f"{self.views[name]}\n\n-- Status: {self.status(name)}")
+
+    def materialize_current(self):
+        """Saves the current query, or the selected part of it, as a materialized view"""
+        if not self.current_query:
+            QMessageBox.critical(self, "No Query", "Please write or select a query before materializing it.")
+            return
+        if query_parameters(self.current_query):
+            QMessageBox.critical(self, "Parameters", "Materialized views can't use :parameters.")
+            return
+
+        name, ok = QInputDialog.getText(self, "Materialize Query", "Name to use in queries:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        if name.lower() in self.sheets or name.lower().startswith("sqlite_"):
+            QMessageBox.critical(self, "Invalid Name", f"'{name}' is already used by a sheet.")
+            return
+        existing = next((view for view in self.views if view.lower() == name.lower()), None)
+        if existing is not None:
+            if QMessageBox.question(self, "Overwrite", f"Replace the materialized view '{existing}'?") != QMessageBox.StandardButton.Yes:
+                return
+            del self.views[existing]
+
+        self.views[name] = self.current_query
+        if self.workspace is not None:
+            self.workspace.invalidate(name)
+        self.store()
+        self.refresh()
+
+    def refresh_selected(self):
+        """Marks the selected view as stale, it's rebuilt the next time a query uses it"""
+        name = self.viewList.currentItem().text() if self.viewList.currentItem() else None
+        if name in self.views and self.workspace is not None:
+            self.workspace.invalidate(name)
+            self.refresh()
+
+    def delete_selected(self):
+        """Deletes the selected view and its table"""
+        name = self.viewList.currentItem().text() if self.viewList.currentItem() else None
+        if name in self.views:
+            del self.views[name]
+            self.store()
+            if self.workspace is not None:
+                try:
+                    self.workspace.drop_view(name)
+                except sqlite3.Error as e:
+                    QMessageBox.critical(self, "Error", f"Failed to remove the table of '{name}': {e}")
+            self.refresh()
+
+    def store(self):
+        """Writes the views to the settings"""
+        self.settings.setValue('materializedViews', json.dumps(self.views))
+
 class LoadFileThread(QThread):
     """Loads the file in a separate thread to avoid freezing the UI"""
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
+    progress = pyqtSignal(str, int, int)
+    profiled = pyqtSignal(dict)
 
-    def __init__(self, input_file):
+    def __init__(self, input_file, workspace):
         super().__init__()
         self.input_file = input_file
+        self.workspace = workspace
 
     def run(self):
         try:
             xls = pd.ExcelFile(self.input_file)
-            loaded_data = {sheet: pd.read_excel(xls, sheet_name=sheet) for sheet in xls.sheet_names}
+            sheet_count = len(xls.sheet_names)
+            row_counts = sheet_row_counts(xls)
+
+            # Report rows if the workbook tells us how many there are, otherwise fall back to sheets
+            if row_counts is not None:
+                reporter = ProgressReporter(self.progress, "Loading", sum(row_counts.values()))
+            else:
+                reporter = ProgressReporter(self.progress, "Loading", sheet_count, unit="sheets")
+
+            # Column profiles are only computed once per version of the workbook
+            fingerprint = workbook_fingerprint(self.input_file)
+            profiles = load_cached_profiles(fingerprint)
+            cached = profiles is not None and set(profiles) == set(map(str, xls.sheet_names))
+            if not cached:
+                profiles = {}
+
+            # Read and ingest one sheet at a time so an on-disk workspace only ever holds one sheet in memory
+            conn = self.workspace.connect(read_only=False)
+            loader = BulkLoader(conn)
+            loaded_data = {}
+            read_rows, read_time = 0, 0.0 # for estimating how long reading the next sheet takes
+            for i, sheet in enumerate(xls.sheet_names):
+                # read_excel doesn't report progress, the sheets read so far give an estimate for the next one
+                eta = row_counts[sheet] * read_time / read_rows if row_counts is not None and read_rows else None
+                reporter.busy(f"Reading '{sheet}' (sheet {i + 1}/{sheet_count})", eta)
+                read_start = time.monotonic()
+                df = pd.read_excel(xls, sheet_name=sheet)
+                read_rows += len(df)
+                read_time += time.monotonic() - read_start
+
+                stage = f"Ingesting '{sheet}' (sheet {i + 1}/{sheet_count})"
+                loader.load(sheet, df, reporter if row_counts is not None else None, stage)
+                self.workspace.mark_loaded(sheet)
+                if row_counts is None:
+                    reporter.advance(1, stage)
+
+                if not cached:
+                    reporter.set_stage(f"Profiling '{sheet}' (sheet {i + 1}/{sheet_count})")
+                    profiles[str(sheet)] = profile_sheet(df)
+
+                reporter.set_stage(f"Indexing '{sheet}' (sheet {i + 1}/{sheet_count})")
+                loader.create_indexes(sheet, index_columns(profiles[str(sheet)]))
+
+                # Only the columns are kept, the rows are in the workspace
+                loaded_data[sheet] = df.head(0)
+                del df
+            loader.close()
+            conn.close()
+
+            if not cached:
+                save_cached_profiles(fingerprint, profiles)
+            self.profiled.emit(profiles)
+
+            self.progress.emit(f"Loaded {sheet_count} sheets", 1, 1)
             self.finished.emit(loaded_data)
         except Exception as e:
             self.error.emit(str(e))
 
+def write_partition(path, df, file_format):
+    """Writes one file of a partitioned export, runs in a worker process"""
+    if file_format == "csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, index=False, sheet_name="SQLResults")
+    return path
+
+def safe_file_name(value, max_length=50):
+    """Turns a partition value into something usable in a file name"""
+    return re.sub(r"[^\w\-. ]", "_", value).strip()[:max_length] or "_"
+
 class ExecuteQueryThread(QThread):
     """Executes the SQL Query in a background thread to keep UI responsive"""
-    finished = pyqtSignal(pd.DataFrame)
+    finished = pyqtSignal(object) # pandas DataFrame
     error = pyqtSignal(str)
     cancel = pyqtSignal()
     update_timer = pyqtSignal(str, int)
+    progress = pyqtSignal(str, int, int)
+    stop_timer = pyqtSignal()
+
+    EXPORT_CHUNK_SIZE = 50_000
+    EXCEL_MAX_ROWS = 1_048_575 # rows per sheet, without the header
+    MAX_PARTITIONS = 1000
 
-    def __init__(self, loaded_data, query, output_file):
+    def __init__(self, workspace, query, output_file, preview_rows=None, parameters=None, partition=None, views=None):
         super().__init__()
-        self.loaded_data = loaded_data
+        self.workspace = workspace
         self.query = query
         self.output_file = output_file
+        self.result_file = output_file # what "Open Output File" opens
+        self.partition = partition
+        self.views = views or {}
+        self.preview_rows = preview_rows
+        self.parameters = parameters
+        self.conn = None
+        self.conn_lock = threading.Lock() # keeps stop_query from interrupting a connection that is back in the pool
         self.stop = False
         self.start_time = time.time()
 
         self.timer = QTimer(self)
         self.timer.setInterval(1000)
         self.timer.timeout.connect(self.update_timer_func)
+        # The timer lives in the main thread, so run() has to stop it through a queued signal
+        self.stop_timer.connect(self.timer.stop)
 
     def run(self):
         try:
-            conn = sqlite3.connect(":memory:")
+            import openpyxl
+            from openpyxl.worksheet.table import Table, TableStyleInfo
 
-            # Load all sheets into SQLite
-            for sheet, df in self.loaded_data.items():
-                if self.stop:
-                    self.cancel_query()
-                    return
-                df.to_sql(sheet, conn, if_exists="replace", index=False)
+            if self.stop:
+                self.cancel_query()
+                return
+
+            # Materialized views the query uses are only built when missing or stale
+            try:
+                self.workspace.refresh_views(self.query, self.views, self.on_view_build, lambda: self.stop)
+            finally:
+                with self.conn_lock:
+                    self.conn = None
 
             if self.stop:
                 self.cancel_query()
                 return
 
-            # Execute the query
-            result_df = pd.read_sql_query(self.query, conn)
+            # Execute the query, SQLite can't tell how far along it is so the progress bar is set to busy
+            self.progress.emit("Running query...", 0, 0)
+            conn = self.workspace.acquire(lambda: self.stop)
+            if conn is None:
+                self.cancel_query()
+                return
+            with self.conn_lock:
+                self.conn = conn
+            try:
+                if self.preview_rows:
+                    result_df = self.fetch_preview(conn)
+                else:
+                    result_df = pd.read_sql_query(self.query, conn, params=self.parameters or None)
+            finally:
+                with self.conn_lock:
+                    self.conn = None
+                self.workspace.release(conn)
 
-            result_df.to_excel(self.output_file, index=False, sheet_name="SQLResults")
+            if self.stop:
+                self.cancel_query()
+                return
+
+            # Previews only fill the output table
+            if self.preview_rows:
+                elapsed_time = time.time() - self.start_time
+                self.update_timer.emit(f"Preview: {len(result_df)} rows in {elapsed_time * 1000:.0f} ms", int(elapsed_time))
+                self.stop_timer.emit()
+                self.finished.emit(result_df)
+                return
+
+            if self.partition:
+                self.export_partitioned(result_df)
+                return
+
+            # Write the result in chunks so progress can be reported
+            reporter = ProgressReporter(self.progress, "Writing", len(result_df))
+            with pd.ExcelWriter(self.output_file, engine="openpyxl") as writer:
+                for start in range(0, max(len(result_df), 1), self.EXPORT_CHUNK_SIZE):
+                    if self.stop:
+                        break
+                    chunk = result_df.iloc[start:start + self.EXPORT_CHUNK_SIZE]
+                    chunk.to_excel(writer, index=False, sheet_name="SQLResults", startrow=start + 1 if start else 0, header=(start == 0))
+                    reporter.advance(len(chunk))
 
             if self.stop:
                 self.cancel_query()
@@ -159,7 +1176,9 @@ class ExecuteQueryThread(QThread):
             ws.add_table(table)
 
             # Adjust column widths
+            reporter = ProgressReporter(self.progress, "Formatting", ws.max_column, unit="columns")
             for column in ws.columns:
+                reporter.advance()
                 if self.stop:
                     wb.save(self.output_file) # save before stopping
                     self.cancel_query()
@@ -174,18 +1193,126 @@ class ExecuteQueryThread(QThread):
                         pass
                 ws.column_dimensions[column_letter].width = max_length + 2
 
+            self.progress.emit("Saving...", 0, 0)
             wb.save(self.output_file)
             wb.close()
 
+            self.progress.emit("Done", 1, 1)
+
             elapsed_time = time.time() - self.start_time
             self.update_timer.emit(f"Done! Took: {int(elapsed_time)}s", int(elapsed_time))
-            self.timer.stop()
+            self.stop_timer.emit()
             self.finished.emit(result_df)
 
         except Exception as e:
-            self.timer.stop()
+            if self.stop:  # interrupted by stop_query
+                self.cancel_query()
+                return
+            self.stop_timer.emit()
             self.error.emit(str(e))
 
+    def export_partitioned(self, result_df):
+        """
+        Splits the result into row ranges or by the values of a column and writes the parts from a process pool,
+        so the export isn't limited to one core. A manifest.json next to the parts describes them.
+        """
+        file_format = self.partition["format"]
+        column = self.partition["column"]
+        base = os.path.splitext(self.output_file)[0]
+        folder = f"{base}_parts"
+        name = os.path.basename(base)
+        os.makedirs(folder, exist_ok=True)
+
+        duplicates = result_df.columns[result_df.columns.duplicated()].unique()
+        if len(duplicates):
+            raise ValueError(f"The result has duplicate column names ({', '.join(map(str, duplicates))}), "
+                             "give them unique aliases to export it partitioned")
+
+        max_rows = self.EXCEL_MAX_ROWS if file_format == "xlsx" else None
+        if column:
+            if column not in result_df.columns:
+                raise ValueError(f"Partition column '{column}' is not part of the result")
+            distinct = result_df[column].nunique(dropna=False)
+            if distinct > self.MAX_PARTITIONS:
+                raise ValueError(f"Partition column '{column}' has {distinct:,} distinct values, "
+                                 f"at most {self.MAX_PARTITIONS:,} partitions can be written")
+            parts = []
+            for value, df in result_df.groupby(column, sort=False, dropna=False):
+                # Values with more rows than fit on a sheet are split over several files
+                size = max_rows or len(df)
+                parts += [(str(value), df.iloc[start:start + size]) for start in range(0, len(df), size)]
+        else:
+            count = self.partition["count"]
+            if max_rows:
+                count = max(count, -(-len(result_df) // max_rows))
+            size = max(-(-len(result_df) // count), 1)
+            parts = [(None, result_df.iloc[start:start + size]) for start in range(0, len(result_df), size)]
+        if not parts:  # empty result, still write the headers
+            parts = [(None, result_df)]
+
+        files = []
+        for i, (value, df) in enumerate(parts, 1):
+            suffix = f"{i:03}" if value is None else f"{i:03}_{safe_file_name(value)}"
+            files.append((os.path.join(folder, f"{name}_{suffix}.{file_format}"), df, value))
+
+        # spawn instead of fork, forking a process with running Qt threads isn't safe
+        reporter = ProgressReporter(self.progress, f"Writing {len(files)} partitions", len(result_df))
+        workers = min(len(files), os.cpu_count() or 1)
+        pool = multiprocessing.get_context("spawn").Pool(workers)
+        try:
+            pending = {pool.apply_async(write_partition, (path, df, file_format)): len(df) for path, df, _ in files}
+            while pending:
+                next(iter(pending)).wait(0.25)
+                if self.stop:
+                    self.cancel_query()
+                    return
+                for result in [result for result in pending if result.ready()]:
+                    result.get() # raises the error of a failed partition
+                    reporter.advance(pending.pop(result))
+            pool.close()
+            pool.join()
+        finally:
+            # Kills the workers still writing after a cancel or a failed partition instead of waiting for them
+            pool.terminate()
+
+        manifest = {
+            "query": self.query,
+            "parameters": self.parameters,
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "format": file_format,
+            "partition_column": column or None,
+            "rows": len(result_df),
+            "columns": [str(column) for column in result_df.columns],
+            "files": [{"file": os.path.basename(path), "rows": len(df), "value": value} for path, df, value in files],
+        }
+        with open(os.path.join(folder, "manifest.json"), 'w') as file:
+            json.dump(manifest, file, indent=2, default=str)
+
+        self.result_file = folder
+        self.progress.emit("Done", 1, 1)
+        elapsed_time = time.time() - self.start_time
+        self.update_timer.emit(f"Done! Wrote {len(files)} files in {int(elapsed_time)}s", int(elapsed_time))
+        self.stop_timer.emit()
+        self.finished.emit(result_df)
+
+    def on_view_build(self, name):
+        """Reports a view build and lets stop_query interrupt it"""
+        self.progress.emit(f"Materializing '{name}'...", 0, 0)
+        with self.conn_lock:
+            self.conn = self.workspace.keeper
+            if self.stop:
+                self.conn.interrupt()
+
+    def fetch_preview(self, conn):
+        """Runs the query unchanged but only fetches the preview rows, SQLite stops stepping after them"""
+        cursor = conn.execute(self.query, self.parameters or ())
+        try:
+            columns = [column[0] for column in cursor.description or ()]
+            # Same conversion as read_sql_query, so previews look like the executed result
+            return pd.DataFrame.from_records(cursor.fetchmany(int(self.preview_rows)), columns=columns, coerce_float=True)
+        finally:
+            cursor.close() # resets the statement, an unfinished one would keep its read lock
+
     def update_timer_func(self):
         """Updates the timer every second"""
         elapsed_time = time.time() - self.start_time
@@ -196,11 +1323,14 @@ class ExecuteQueryThread(QThread):
         self.cancel.emit()
         elapsed_time = time.time() - self.start_time
         self.update_timer.emit(f"Query cancelled after: {int(elapsed_time)}s", int(elapsed_time))
-        self.timer.stop()
+        self.stop_timer.emit()
 
     def stop_query(self):
-        """Set flag to stop the thread"""
+        """Set flag to stop the thread and abort a running SQLite statement"""
         self.stop = True
+        with self.conn_lock:
+            if self.conn is not None:
+                self.conn.interrupt()
 
 class MainWindow(QMainWindow, Ui_MainWindow):
     def __init__(self):
@@ -217,20 +1347,33 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.output_file = None
         self.xls = None
         self.loaded_data = None
+        self.column_profiles = {}
         self.skip_load_dialog = False
         self.done_loading = False
         self.elapsed = 0
+        self.progress_msg = ""
         self.load_thread = None
-        self.query_thread = None
+        self.workspace = None
+        self.retired_workspaces = [] # replaced workspaces, closed once their jobs are done
+        self.jobs = [] # queued and running query jobs
+        self.query_tabs = [QueryTab(self.queryTab, self.queryInput)]
+        self.tab_counter = 1
+        self.queue_window = None
         self.tableVisible = False
         self.fullscreen = False
         self.oldHeight = None
-        self.table_model = OutputTableModel(pd.DataFrame())
 
         # Settings
         self.enableExperimentalFeatures = False
         self.hideSuccess = False
         self.showOutputTable = False
+        self.maxConcurrentQueries = 2
+        self.previewRows = 500
+        self.onDiskWorkspace = False
+        self.partitionedExport = False
+        self.partitionCount = 4
+        self.partitionColumn = ''
+        self.partitionFormat = 'xlsx'
 
         self.update_settings()
 
@@ -241,14 +1384,27 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.outputTable.setVisible(False)
         self.fullscreenTableButton.setVisible(False)
 
-        self.outputTable.setModel(self.table_model)
+        self.outputTable.setModel(self.query_tabs[0].table_model)
+
+        # Progress bar for loading and query execution
+        self.progressBar = QProgressBar()
+        self.progressBar.setMaximumWidth(200)
+        self.progressBar.setVisible(False)
+        self.statusbar.addPermanentWidget(self.progressBar)
 
         self.inputButton.clicked.connect(self.load_file)
         self.outputButton.clicked.connect(self.save_file)
         self.loadQueryButton.clicked.connect(self.load_sql_query)
         self.saveQueryButton.clicked.connect(self.save_sql_query)
         self.executeButton.clicked.connect(self.execute_query)
+        self.previewButton.clicked.connect(self.preview_query)
         self.cancelButton.clicked.connect(self.cancel_query)
+        self.newTabButton.clicked.connect(lambda: self.new_query_tab())
+        self.libraryButton.clicked.connect(self.open_library)
+        self.viewsButton.clicked.connect(self.open_views)
+        self.queueButton.clicked.connect(self.open_queue_window)
+        self.queryTabWidget.currentChanged.connect(self.on_tab_changed)
+        self.queryTabWidget.tabCloseRequested.connect(self.close_query_tab)
         self.sheetList.clicked.connect(self.on_sheet_select)
         self.inputInput.returnPressed.connect(self.load_file_quiet)
         self.showTableButton.clicked.connect(self.toggle_output_table)
@@ -267,12 +1423,22 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.enableExperimentalFeatures = self.settings.value('experimentalFeatures', type=bool)
         self.hideSuccess = self.settings.value('hideSuccess', type=bool)
         self.showOutputTable = self.settings.value('showOutputTable', type=bool)
+        self.maxConcurrentQueries = self.settings.value('maxConcurrentQueries', 2, type=int)
+        self.previewRows = self.settings.value('previewRows', 500, type=int)
+        self.onDiskWorkspace = self.settings.value('onDiskWorkspace', type=bool)
+        self.partitionedExport = self.settings.value('partitionedExport', type=bool)
+        self.partitionCount = self.settings.value('partitionCount', 4, type=int)
+        self.partitionColumn = self.settings.value('partitionColumn', '', type=str)
+        self.partitionFormat = self.settings.value('partitionFormat', 'xlsx', type=str)
 
         if self.tableVisible is True:
             self.fullscreenTableButton.setVisible(self.enableExperimentalFeatures)
         else:
             self.fullscreenTableButton.setVisible(False)
 
+        # A higher limit may allow queued jobs to start
+        self.schedule_jobs()
+
     def hide_widgets(self, layout):
         """Hides all widgets except output table"""
         for i in range(layout.count()):
@@ -374,9 +1540,19 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 # Show the sheet count **immediately**
                 self.sheetNumLabel.setText(f"Sheets: {len(sheet_names)}")
 
-                self.load_thread = LoadFileThread(self.input_file)
+                # Fresh workspace for the new file, queued jobs keep the previous one alive until they are done
+                self.done_loading = False
+                self.column_profiles = {}
+                if self.workspace is not None:
+                    self.retired_workspaces.append(self.workspace)
+                self.workspace = Workspace(self.onDiskWorkspace)
+                self.close_retired_workspaces()
+
+                self.load_thread = LoadFileThread(self.input_file, self.workspace)
                 self.load_thread.finished.connect(self.on_file_loaded)
                 self.load_thread.error.connect(self.on_file_load_error)
+                self.load_thread.progress.connect(self.update_progress)
+                self.load_thread.profiled.connect(self.on_file_profiled)
                 self.load_thread.start()
 
             except Exception as e:
@@ -391,19 +1567,37 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def on_file_loaded(self, loaded_data):
         """Populates sheetlist when file loading is finished"""
+        self.hide_progress()
         self.loaded_data = loaded_data
         self.sheetList.clear()
         for sheet in self.xls.sheet_names:
             self.sheetList.addItem(sheet)
+            if str(sheet) in self.column_profiles:
+                self.sheetList.item(self.sheetList.count() - 1).setToolTip(f"{self.column_profiles[str(sheet)]['rows']:,} rows")
         self.columnList.addItem("Select sheet to see columns")
         self.done_loading = True
+        self.close_retired_workspaces()
+
+    def close_retired_workspaces(self):
+        """Closes replaced workspaces that no job or load uses anymore"""
+        loading = self.load_thread.workspace if self.load_thread is not None and self.load_thread.isRunning() else None
+        for workspace in list(self.retired_workspaces):
+            if workspace is not loading and not any(job.workspace is workspace for job in self.jobs):
+                self.retired_workspaces.remove(workspace)
+                workspace.close()
+
+    def on_file_profiled(self, profiles):
+        """Stores the column profiles shown as tooltips"""
+        self.column_profiles = profiles
 
     def on_file_load_error(self, e):
         """Shows error when file loading encounteres an error"""
+        self.hide_progress()
         QMessageBox.critical(self, "Error", f"Failed to load file: {e}")
         self.sheetList.clear()
         self.sheetList.addItem(f"Failed to load file")
         self.done_loading = True
+        self.close_retired_workspaces()
 
     def on_sheet_select(self):
         """Handle sheet selection and display columns in the second listbox"""
@@ -417,8 +1611,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 # Fetch columns of the selected sheet
                 if selected_sheet in self.loaded_data:
                     columns = self.loaded_data[selected_sheet].columns
+                    sheet_profile = self.column_profiles.get(str(selected_sheet))
                     for column in columns:
                         self.columnList.addItem(column)  # Insert each column into the column listbox
+
+                        # Show the column statistics on hover
+                        if sheet_profile is not None and str(column) in sheet_profile["columns"]:
+                            tooltip = format_column_profile(sheet_profile["columns"][str(column)], sheet_profile["rows"])
+                            self.columnList.item(self.columnList.count() - 1).setToolTip(tooltip)
             except (IndexError, KeyError, AttributeError):
                 return
 
@@ -434,12 +1634,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         query_file, _ = QFileDialog.getOpenFileName(self, "Select Query File", "", "Text Files (*.txt)")
         if query_file:
             with open(query_file, 'r') as file:
-                self.queryInput.clear()
-                self.queryInput.setPlainText(file.read())
+                editor = self.current_tab().editor
+                editor.clear()
+                editor.setPlainText(file.read())
 
     def save_sql_query(self):
         """Save the current query to a file"""
-        query_text = self.queryInput.toPlainText()  # Get the text from the query box
+        query_text = self.current_tab().editor.toPlainText()  # Get the text from the query box
         if not query_text:
             QMessageBox.critical(self, "No Query", "Please write a query before saving.")
             return
@@ -454,11 +1655,89 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save query: {e}")
 
+    def current_tab(self):
+        """Returns the QueryTab that is currently shown"""
+        page = self.queryTabWidget.currentWidget()
+        return next(tab for tab in self.query_tabs if tab.page is page)
+
+    def open_library(self):
+        """Opens the saved query library, the chosen query is opened in a new tab"""
+        tab = self.current_tab()
+        library_window = LibraryWindow(tab.editor.toPlainText(), tab.parameters, self)
+        if not library_window.exec() or library_window.selected is None:
+            return
+
+        saved = library_window.queries[library_window.selected]
+        self.new_query_tab(library_window.selected)
+        tab = self.current_tab()
+        tab.editor.setPlainText(saved["query"])
+        tab.parameters = dict(saved.get("parameters", {}))
+
+    def open_views(self):
+        """Opens the materialized views, the current query or its selected part can be materialized"""
+        editor = self.current_tab().editor
+        # Selecting a CTE's body materializes just that part, Qt separates the selected lines with U+2029
+        query = editor.textCursor().selectedText().replace("\u2029", "\n") or editor.toPlainText()
+        sheets = list(self.loaded_data) if self.done_loading and self.loaded_data else []
+        ViewsWindow(query.strip(), self.workspace, sheets, self).exec()
+
+    def new_query_tab(self, name=None):
+        """Adds an empty query tab with its own result table"""
+        self.tab_counter += 1
+        page = QWidget()
+        layout = QHBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        editor = QPlainTextEdit(parent=page)
+        layout.addWidget(editor)
+
+        self.query_tabs.append(QueryTab(page, editor))
+        self.queryTabWidget.setCurrentIndex(self.queryTabWidget.addTab(page, name or f"Query {self.tab_counter}"))
+        editor.setFocus()
+
+    def close_query_tab(self, index):
+        """Closes a query tab and cancels its job, the last tab can't be closed"""
+        if self.queryTabWidget.count() == 1:
+            return
+
+        page = self.queryTabWidget.widget(index)
+        tab = next(tab for tab in self.query_tabs if tab.page is page)
+        if tab.job is not None:
+            self.cancel_job(tab.job)
+        self.query_tabs.remove(tab)
+        self.queryTabWidget.removeTab(index)
+        page.deleteLater()
+
+    def on_tab_changed(self):
+        """Shows the result table and job status of the selected tab"""
+        if self.queryTabWidget.currentWidget() is None:
+            return
+        tab = self.current_tab()
+        self.outputTable.setModel(tab.table_model)
+
+        if tab.job is None:
+            self.hide_progress()
+            self.statusbar.clearMessage()
+            return
+        if tab.job.progress is not None:
+            self.update_progress(*tab.job.progress)
+        if tab.job.timer_msg:
+            self.statusbar.showMessage(tab.job.timer_msg)
+
     def execute_query(self):
-        """Execute the SQL query on the selected input file and save the result to the output file"""
+        """Queue the SQL query of the current tab, it runs as soon as a worker slot is free"""
+        self.submit_query()
+
+    def preview_query(self):
+        """Queue a preview of the current tab's query that only fetches the first rows and writes no file"""
+        self.submit_query(preview_rows=self.previewRows)
+
+    def submit_query(self, preview_rows=None):
+        """Validates the input and queues a job for the current tab"""
         self.output_file = self.outputIInput.text()
+        tab = self.current_tab()
+        query = tab.editor.toPlainText()
 
-        if not self.input_file or not self.output_file or not self.queryInput.toPlainText():
+        if not self.input_file or (not self.output_file and not preview_rows) or not query:
             QMessageBox.critical(self, "Error", "Please fill in all fields.")
             return
 
@@ -466,22 +1745,154 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             QMessageBox.critical(self, "Error", "Please wait for data to load.")
             return
 
-        self.statusbar.showMessage("Running: 0s")  # Reset timer display
+        if tab.job is not None:
+            QMessageBox.critical(self, "Error", "A query is already queued or running in this tab.")
+            return
 
-        self.query_thread = ExecuteQueryThread(self.loaded_data, self.queryInput.toPlainText(), self.output_file)
-        self.query_thread.finished.connect(self.query_finished)
-        self.query_thread.error.connect(self.query_error)
-        self.query_thread.cancel.connect(self.query_cancelled)
-        self.query_thread.update_timer.connect(self.update_timer)
-        self.query_thread.start()
+        # Ask for the values of :param placeholders, they are bound instead of pasted into the query
+        parameters = None
+        names = query_parameters(query)
+        if names:
+            parameter_window = ParameterWindow(names, tab.parameters, self)
+            if not parameter_window.exec():
+                return
+            tab.parameters.update(parameter_window.values())
+            parameters = {name: parse_parameter(tab.parameters[name]) for name in names}
+
+        if not preview_rows and any(not job.preview_rows and os.path.abspath(job.output_file) == os.path.abspath(self.output_file) for job in self.jobs):
+            QMessageBox.critical(self, "Error", "Another query is already writing to this output file.")
+            return
+
+        tab_name = self.queryTabWidget.tabText(self.queryTabWidget.currentIndex())
+        if preview_rows:
+            tab_name += " (Preview)"
+        partition = None
+        if self.partitionedExport and not preview_rows:
+            partition = {"count": self.partitionCount, "column": self.partitionColumn, "format": self.partitionFormat}
+
+        views = json.loads(self.settings.value('materializedViews', '{}'))
+        tab.job = QueryJob(tab, tab_name, query, self.output_file, self.workspace, preview_rows, parameters, partition, views)
+        self.jobs.append(tab.job)
+        self.statusbar.showMessage("Queued")
+        self.schedule_jobs()
+
+    def schedule_jobs(self):
+        """Starts queued jobs by priority until the concurrency limit is reached"""
+        running = [job for job in self.jobs if job.thread is not None]
+        queued = sorted((job for job in self.jobs if job.thread is None), key=lambda job: (-job.priority, job.id))
+        for job in queued[:max(self.maxConcurrentQueries - len(running), 0)]:
+            self.start_job(job)
+        self.refresh_queue_window()
+
+    def start_job(self, job):
+        """Runs a job on its own ExecuteQueryThread"""
+        job.status = "Running"
+        job.thread = ExecuteQueryThread(job.workspace, job.query, job.output_file, job.preview_rows, job.parameters, job.partition, job.views)
+        job.thread.finished.connect(partial(self.query_finished, job))
+        job.thread.error.connect(partial(self.query_error, job))
+        job.thread.cancel.connect(partial(self.query_cancelled, job))
+        job.thread.update_timer.connect(partial(self.update_job_timer, job))
+        job.thread.progress.connect(partial(self.update_job_progress, job))
+        job.thread.start()
+        job.thread.timer.start()
+
+    def job_done(self, job):
+        """Removes a finished, failed or cancelled job and starts the next one"""
+        if job.thread is not None:
+            job.thread.wait() # run() returns right after its last signal
+        if job in self.jobs:
+            self.jobs.remove(job)
+            self.close_retired_workspaces()
+        job.tab.job = None
+        if job.tab in self.query_tabs and job.tab is self.current_tab():
+            self.hide_progress()
+        self.schedule_jobs()
+
+    def cancel_job(self, job):
+        """Removes a queued job or stops a running one"""
+        if job.thread is None:
+            self.jobs.remove(job)
+            self.close_retired_workspaces()
+            job.tab.job = None
+            self.statusbar.showMessage(f"Removed {job.tab_name} from the queue")
+            self.refresh_queue_window()
+        else:
+            job.status = "Cancelling"
+            job.thread.stop_query()
+            self.refresh_queue_window()
+
+    def find_job(self, job_id):
+        """Returns the queued or running job with the given id or None"""
+        return next((job for job in self.jobs if job.id == job_id), None)
+
+    def cancel_job_by_id(self, job_id):
+        """Cancels a job selected in the queue window"""
+        job = self.find_job(job_id)
+        if job is not None:
+            self.cancel_job(job)
+
+    def change_job_priority(self, job_id, delta):
+        """Changes the priority of a job, only affects jobs that are still queued"""
+        job = self.find_job(job_id)
+        if job is not None:
+            job.priority += delta
+            self.refresh_queue_window()
+
+    def open_queue_window(self):
+        """Opens the query queue window"""
+        if self.queue_window is None:
+            self.queue_window = QueueWindow(self)
+            self.queue_window.cancel_job.connect(self.cancel_job_by_id)
+            self.queue_window.change_priority.connect(self.change_job_priority)
+        self.refresh_queue_window()
+        self.queue_window.show()
+        self.queue_window.raise_()
+
+    def refresh_queue_window(self):
+        """Updates the queue window if it is open"""
+        if self.queue_window is not None and self.queue_window.isVisible():
+            running = [job for job in self.jobs if job.thread is not None]
+            queued = sorted((job for job in self.jobs if job.thread is None), key=lambda job: (-job.priority, job.id))
+            self.queue_window.refresh(running + queued)
+
+    def update_job_timer(self, job, msg, elapsed):
+        """Stores the elapsed time of a job and shows it if the job belongs to the current tab"""
+        job.timer_msg = msg
+        job.elapsed = elapsed
+        if job.tab is self.current_tab():
+            self.update_timer(msg, elapsed)
+        self.refresh_queue_window()
+
+    def update_job_progress(self, job, msg, done, total):
+        """Stores the progress of a job and shows it if the job belongs to the current tab"""
+        job.progress = (msg, done, total)
+        if job.tab is self.current_tab():
+            self.update_progress(msg, done, total)
 
     def update_timer(self, msg, elapsed):
         """Updates the timer in the statusbar"""
+        if self.progress_msg and msg.startswith("Running"):
+            msg = f"{msg} - {self.progress_msg}"
         self.statusbar.showMessage(msg)
         self.elapsed = elapsed
 
-    def query_finished(self, result_df):
-        """Populates output table after query is finished and shows success message"""
+    def update_progress(self, msg, done, total):
+        """Updates the progress bar and progress message, a total of 0 shows a busy indicator"""
+        self.progressBar.setVisible(True)
+        self.progressBar.setMaximum(total)
+        self.progressBar.setValue(min(done, total))
+        self.progress_msg = msg
+        self.statusbar.showMessage(msg)
+
+    def hide_progress(self):
+        """Hides the progress bar once a job has ended"""
+        self.progressBar.setVisible(False)
+        self.progress_msg = ""
+
+    def query_finished(self, job, result_df):
+        """Populates the tab's output table after the query is finished and shows success message"""
+        self.job_done(job)
+
         # self.outputTable.blockSignals(True)  # Prevent UI from processing signals during update
         # self.outputTable.setUpdatesEnabled(False)  # Stop rendering updates temporarily
         #
@@ -501,43 +1912,46 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # self.outputTable.blockSignals(False)  # Allow UI to process updates
         # self.outputTable.viewport().update()  # Force a repaint
 
-        self.table_model.beginResetModel() # Notify the view that a big update is happening
-        self.table_model._data = result_df # Refresh the view
-        self.table_model.endResetModel() # Refresh the view
+        job.tab.table_model.beginResetModel() # Notify the view that a big update is happening
+        job.tab.table_model._data = result_df # Refresh the view
+        job.tab.table_model.endResetModel() # Refresh the view
 
-        if not self.hideSuccess:
-            self.show_success_dialog()
+        if job.preview_rows:
+            if not self.tableVisible:
+                self.toggle_output_table()
+        elif not self.hideSuccess:
+            self.show_success_dialog(job)
         elif self.showOutputTable and not self.tableVisible:
             self.toggle_output_table()
 
-    def query_error(self, e):
+    def query_error(self, job, e):
         """Displays an error message if the query fails"""
-        QMessageBox.critical(self, "Error", f"An error occurred: {e}")
+        self.job_done(job)
+        QMessageBox.critical(self, "Error", f"An error occurred in {job.tab_name}: {e}")
 
     def cancel_query(self):
-        """Cancels the Query"""
-        try:
-            self.query_thread.stop_query()
-        except AttributeError:
-            return
+        """Cancels the query of the current tab"""
+        job = self.current_tab().job
+        if job is not None:
+            self.cancel_job(job)
 
-    def query_cancelled(self):
+    def query_cancelled(self, job):
         """Displays message that query has been cancelled"""
-        self.query_thread.quit()
-        QMessageBox.information(self, "Query cancelled", "Query has been cancelled.")
+        self.job_done(job)
+        QMessageBox.information(self, "Query cancelled", f"{job.tab_name} has been cancelled.")
 
-    def show_success_dialog(self):
+    def show_success_dialog(self, job):
         """Shows a success dialog with a button to open the output file"""
         self.success_msg_box = QMessageBox(self)
         self.success_msg_box.setWindowTitle("Execution Complete")
-        self.success_msg_box.setText(f"Query executed successfully!\nTook {self.elapsed} seconds")
+        self.success_msg_box.setText(f"{job.tab_name} executed successfully!\nTook {job.elapsed} seconds")
         self.success_msg_box.setIcon(QMessageBox.Icon.Information)
 
         # Add custom buttons
         open_button = QPushButton("Open Output File")
         close_button = QPushButton("Close")
 
-        open_button.clicked.connect(self.open_output_file)
+        open_button.clicked.connect(partial(self.open_output_file, job.thread.result_file))
         close_button.clicked.connect(self.success_msg_box.close)
 
         self.success_msg_box.addButton(open_button, QMessageBox.ButtonRole.AcceptRole)
@@ -561,18 +1975,70 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.cancel_msg_box.exec()
 
-    def open_output_file(self):
+    def open_output_file(self, output_file):
         """Opens the output file with the default program"""
         try:
             if os.name == 'nt':  # Windows
-                os.startfile(self.output_file)
+                os.startfile(output_file)
             elif os.name == 'posix':  # Mac/Linux
-                subprocess.run(['open', self.output_file])
+                subprocess.run(['open', output_file])
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", f"Could not open the file: {e}")
         self.success_msg_box.close()
 
+    def closeEvent(self, event):
+        """Stops all running queries and removes the workspaces before closing"""
+        for job in list(self.jobs):
+            if job.thread is not None:
+                job.thread.stop_query()
+                job.thread.wait()
+        self.jobs.clear()
+        if self.load_thread is not None:
+            self.load_thread.wait()
+        self.close_retired_workspaces()
+        if self.workspace is not None:
+            self.workspace.close()
+        super().closeEvent(event)
+
+def profile_imports(base_path, top=15):
+    """
+    Prints the slowest imports of a cold start using python -X importtime.
+    Startup imports delay the window, deferred imports are warmed up in the background after it is shown.
+    """
+    if getattr(sys, 'frozen', False):
+        print("Import profiling needs a Python interpreter, run main.py instead of the executable.")
+        return
+
+    marker = "--deferred imports--"
+    code = f"import sys, main; print({marker!r}, file=sys.stderr, flush=True); main.warm_up_imports()"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=base_path, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr)
+        return
+
+    sections = {"Startup": [], "Deferred": []}
+    section = sections["Startup"]
+    for line in result.stderr.splitlines():
+        if line == marker:
+            section = sections["Deferred"]
+        elif line.startswith("import time:") and not line.endswith("imported package"):
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            if self_us.strip().isdigit():
+                section.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    for title, imports in sections.items():
+        # Top level imports have the least indentation, their cumulative times add up to the total
+        indent = min((len(name) - len(name.lstrip()) for _, _, name in imports), default=0)
+        total = sum(cumulative for cumulative, _, name in imports if len(name) - len(name.lstrip()) == indent)
+        print(f"{title} imports: {total / 1000:.0f} ms")
+        print(f"  {'cumulative':>10}  {'self':>8}  module")
+        for cumulative, self_us, name in sorted(imports, reverse=True)[:top]:
+            print(f"  {cumulative / 1000:>8.1f}ms  {self_us / 1000:>6.1f}ms  {name.strip()}")
+        print()
+
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # partitioned exports start worker processes from the frozen executable
+
     if getattr(sys, 'frozen', False):
         # Running as a bundled PyInstaller executable
         base_path = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
@@ -583,8 +2049,23 @@ if __name__ == "__main__":
     icon_path = os.path.join(base_path, "Excel_SQL_Icon.ico")
     icon_png_path = os.path.join(base_path, "Excel_SQL_Icon.png")
 
+    if "--profile-imports" in sys.argv:
+        profile_imports(base_path)
+        sys.exit(0)
+
     app = QApplication(sys.argv)
     app.setWindowIcon(QtGui.QIcon(QtGui.QPixmap(icon_path)))
+
+    # Show a splash screen right away, the window follows as soon as it is built
+    splash = QSplashScreen(QtGui.QPixmap(icon_png_path).scaled(256, 256, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+    splash.show()
+    app.processEvents()
+
     window = MainWindow()
     window.show()  # Show the window
+    splash.finish(window)
+
+    # Import pandas and openpyxl in the background so the first file load doesn't have to wait for them
+    threading.Thread(target=warm_up_imports, daemon=True).start()
+
     sys.exit(app.exec())
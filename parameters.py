@@ -0,0 +1,38 @@
+# Form implementation generated from reading ui file 'parameters.ui'
+#
+# Created by: PyQt6 UI code generator 6.8.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ParameterWindow(object):
+    def setupUi(self, ParameterWindow):
+        ParameterWindow.setObjectName("ParameterWindow")
+        ParameterWindow.resize(360, 160)
+        self.verticalLayout = QtWidgets.QVBoxLayout(ParameterWindow)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.infoLabel = QtWidgets.QLabel(parent=ParameterWindow)
+        self.infoLabel.setObjectName("infoLabel")
+        self.verticalLayout.addWidget(self.infoLabel)
+        self.parameterForm = QtWidgets.QFormLayout()
+        self.parameterForm.setObjectName("parameterForm")
+        self.verticalLayout.addLayout(self.parameterForm)
+        self.buttonBox = QtWidgets.QDialogButtonBox(parent=ParameterWindow)
+        self.buttonBox.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Cancel|QtWidgets.QDialogButtonBox.StandardButton.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(ParameterWindow)
+        self.buttonBox.accepted.connect(ParameterWindow.accept) # type: ignore
+        self.buttonBox.rejected.connect(ParameterWindow.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(ParameterWindow)
+
+    def retranslateUi(self, ParameterWindow):
+        _translate = QtCore.QCoreApplication.translate
+        ParameterWindow.setWindowTitle(_translate("ParameterWindow", "Dialog"))
+        self.infoLabel.setText(_translate("ParameterWindow", "Fill in the query parameters:"))
@@ -38,10 +38,89 @@ class Ui_SettingsWindow(object):
         self.hideSuccessCheckBox = QtWidgets.QCheckBox(parent=self.generalTab)
         self.hideSuccessCheckBox.setObjectName("hideSuccessCheckBox")
         self.gridLayout_2.addWidget(self.hideSuccessCheckBox, 3, 0, 1, 1)
+        self.onDiskWorkspaceCheckBox = QtWidgets.QCheckBox(parent=self.generalTab)
+        self.onDiskWorkspaceCheckBox.setObjectName("onDiskWorkspaceCheckBox")
+        self.gridLayout_2.addWidget(self.onDiskWorkspaceCheckBox, 6, 0, 1, 1)
         self.experimentalFeaturesCheckBox = QtWidgets.QCheckBox(parent=self.generalTab)
         self.experimentalFeaturesCheckBox.setObjectName("experimentalFeaturesCheckBox")
         self.gridLayout_2.addWidget(self.experimentalFeaturesCheckBox, 1, 0, 1, 1)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.maxConcurrentQueriesLabel = QtWidgets.QLabel(parent=self.generalTab)
+        self.maxConcurrentQueriesLabel.setObjectName("maxConcurrentQueriesLabel")
+        self.horizontalLayout_2.addWidget(self.maxConcurrentQueriesLabel)
+        self.maxConcurrentQueriesSpinBox = QtWidgets.QSpinBox(parent=self.generalTab)
+        self.maxConcurrentQueriesSpinBox.setMinimum(1)
+        self.maxConcurrentQueriesSpinBox.setMaximum(16)
+        self.maxConcurrentQueriesSpinBox.setProperty("value", 2)
+        self.maxConcurrentQueriesSpinBox.setObjectName("maxConcurrentQueriesSpinBox")
+        self.horizontalLayout_2.addWidget(self.maxConcurrentQueriesSpinBox)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem1)
+        self.gridLayout_2.addLayout(self.horizontalLayout_2, 4, 0, 1, 1)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.previewRowsLabel = QtWidgets.QLabel(parent=self.generalTab)
+        self.previewRowsLabel.setObjectName("previewRowsLabel")
+        self.horizontalLayout_3.addWidget(self.previewRowsLabel)
+        self.previewRowsSpinBox = QtWidgets.QSpinBox(parent=self.generalTab)
+        self.previewRowsSpinBox.setMinimum(1)
+        self.previewRowsSpinBox.setMaximum(100000)
+        self.previewRowsSpinBox.setProperty("value", 500)
+        self.previewRowsSpinBox.setObjectName("previewRowsSpinBox")
+        self.horizontalLayout_3.addWidget(self.previewRowsSpinBox)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem2)
+        self.gridLayout_2.addLayout(self.horizontalLayout_3, 5, 0, 1, 1)
         self.tabWidget.addTab(self.generalTab, "")
+        self.exportTab = QtWidgets.QWidget()
+        self.exportTab.setObjectName("exportTab")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.exportTab)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.partitionedExportCheckBox = QtWidgets.QCheckBox(parent=self.exportTab)
+        self.partitionedExportCheckBox.setObjectName("partitionedExportCheckBox")
+        self.gridLayout_3.addWidget(self.partitionedExportCheckBox, 0, 0, 1, 1)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.partitionCountLabel = QtWidgets.QLabel(parent=self.exportTab)
+        self.partitionCountLabel.setObjectName("partitionCountLabel")
+        self.horizontalLayout_4.addWidget(self.partitionCountLabel)
+        self.partitionCountSpinBox = QtWidgets.QSpinBox(parent=self.exportTab)
+        self.partitionCountSpinBox.setMinimum(1)
+        self.partitionCountSpinBox.setMaximum(64)
+        self.partitionCountSpinBox.setProperty("value", 4)
+        self.partitionCountSpinBox.setObjectName("partitionCountSpinBox")
+        self.horizontalLayout_4.addWidget(self.partitionCountSpinBox)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem3)
+        self.gridLayout_3.addLayout(self.horizontalLayout_4, 1, 0, 1, 1)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.partitionColumnLabel = QtWidgets.QLabel(parent=self.exportTab)
+        self.partitionColumnLabel.setObjectName("partitionColumnLabel")
+        self.horizontalLayout_5.addWidget(self.partitionColumnLabel)
+        self.partitionColumnInput = QtWidgets.QLineEdit(parent=self.exportTab)
+        self.partitionColumnInput.setObjectName("partitionColumnInput")
+        self.horizontalLayout_5.addWidget(self.partitionColumnInput)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem4)
+        self.gridLayout_3.addLayout(self.horizontalLayout_5, 2, 0, 1, 1)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.partitionFormatLabel = QtWidgets.QLabel(parent=self.exportTab)
+        self.partitionFormatLabel.setObjectName("partitionFormatLabel")
+        self.horizontalLayout_6.addWidget(self.partitionFormatLabel)
+        self.partitionFormatComboBox = QtWidgets.QComboBox(parent=self.exportTab)
+        self.partitionFormatComboBox.setObjectName("partitionFormatComboBox")
+        self.partitionFormatComboBox.addItem("")
+        self.partitionFormatComboBox.addItem("")
+        self.horizontalLayout_6.addWidget(self.partitionFormatComboBox)
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_6.addItem(spacerItem5)
+        self.gridLayout_3.addLayout(self.horizontalLayout_6, 3, 0, 1, 1)
+        spacerItem6 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_3.addItem(spacerItem6, 4, 0, 1, 1)
+        self.tabWidget.addTab(self.exportTab, "")
         self.infoTab = QtWidgets.QWidget()
         self.infoTab.setObjectName("infoTab")
         self.verticalLayout = QtWidgets.QVBoxLayout(self.infoTab)
@@ -68,7 +147,19 @@ class Ui_SettingsWindow(object):
         self.closeButton.setText(_translate("SettingsWindow", " Close "))
         self.showOutputTableCheckBox.setText(_translate("SettingsWindow", "Automatically show Output Table after Execution"))
         self.hideSuccessCheckBox.setText(_translate("SettingsWindow", "Hide Success Dialog"))
+        self.onDiskWorkspaceCheckBox.setToolTip(_translate("SettingsWindow", "Stores loaded sheets in a temporary file instead of RAM. Takes effect on the next file load."))
+        self.onDiskWorkspaceCheckBox.setText(_translate("SettingsWindow", "Keep Workspace on Disk (for Workbooks larger than RAM)"))
         self.experimentalFeaturesCheckBox.setText(_translate("SettingsWindow", "Enable Experimental Features"))
+        self.maxConcurrentQueriesLabel.setText(_translate("SettingsWindow", "Maximum concurrent Queries"))
+        self.previewRowsLabel.setText(_translate("SettingsWindow", "Rows shown in Query Preview"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.generalTab), _translate("SettingsWindow", "General"))
+        self.partitionedExportCheckBox.setText(_translate("SettingsWindow", "Export Results as Partitioned Files written in parallel"))
+        self.partitionCountLabel.setText(_translate("SettingsWindow", "Partitions"))
+        self.partitionColumnLabel.setText(_translate("SettingsWindow", "Partition Column"))
+        self.partitionColumnInput.setPlaceholderText(_translate("SettingsWindow", "Optional, splits into equal row ranges if empty"))
+        self.partitionFormatLabel.setText(_translate("SettingsWindow", "File Format"))
+        self.partitionFormatComboBox.setItemText(0, _translate("SettingsWindow", "xlsx"))
+        self.partitionFormatComboBox.setItemText(1, _translate("SettingsWindow", "csv"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.exportTab), _translate("SettingsWindow", "Export"))
         self.infoLabel.setText(_translate("SettingsWindow", "<html><head/><body><p><span style=\" font-weight:700;\">SQL Query Tool for Excel</span></p><p>Version: 2.0.0</p><p>Developed by Manyullyn17<br/></p><p>A lightweight tool for running SQL queries on Excel files.<br/></p><p><a href=\"https://github.com/Manyullyn17/Excel_SQL_GUI\"><span style=\" text-decoration: underline; color:#007af4;\">GitHub Repo</span></a><br/></p><p><span style=\" font-style:italic;\">Powered by Python, PyQt6, Pandas, openpyxl, and SQLite.</span></p></body></html>"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.infoTab), _translate("SettingsWindow", "Info"))
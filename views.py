@@ -0,0 +1,56 @@
+# Form implementation generated from reading ui file 'views.ui'
+#
+# Created by: PyQt6 UI code generator 6.8.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ViewsWindow(object):
+    def setupUi(self, ViewsWindow):
+        ViewsWindow.setObjectName("ViewsWindow")
+        ViewsWindow.resize(600, 360)
+        self.verticalLayout = QtWidgets.QVBoxLayout(ViewsWindow)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.viewList = QtWidgets.QListWidget(parent=ViewsWindow)
+        self.viewList.setObjectName("viewList")
+        self.horizontalLayout_2.addWidget(self.viewList)
+        self.viewPreview = QtWidgets.QPlainTextEdit(parent=ViewsWindow)
+        self.viewPreview.setReadOnly(True)
+        self.viewPreview.setObjectName("viewPreview")
+        self.horizontalLayout_2.addWidget(self.viewPreview)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.materializeCurrentButton = QtWidgets.QPushButton(parent=ViewsWindow)
+        self.materializeCurrentButton.setObjectName("materializeCurrentButton")
+        self.horizontalLayout.addWidget(self.materializeCurrentButton)
+        self.refreshButton = QtWidgets.QPushButton(parent=ViewsWindow)
+        self.refreshButton.setObjectName("refreshButton")
+        self.horizontalLayout.addWidget(self.refreshButton)
+        self.deleteButton = QtWidgets.QPushButton(parent=ViewsWindow)
+        self.deleteButton.setObjectName("deleteButton")
+        self.horizontalLayout.addWidget(self.deleteButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.closeButton = QtWidgets.QPushButton(parent=ViewsWindow)
+        self.closeButton.setObjectName("closeButton")
+        self.horizontalLayout.addWidget(self.closeButton)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(ViewsWindow)
+        self.closeButton.clicked.connect(ViewsWindow.close) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(ViewsWindow)
+
+    def retranslateUi(self, ViewsWindow):
+        _translate = QtCore.QCoreApplication.translate
+        ViewsWindow.setWindowTitle(_translate("ViewsWindow", "Form"))
+        self.materializeCurrentButton.setText(_translate("ViewsWindow", " Materialize Current Query "))
+        self.refreshButton.setText(_translate("ViewsWindow", " Refresh "))
+        self.deleteButton.setText(_translate("ViewsWindow", " Delete "))
+        self.closeButton.setText(_translate("ViewsWindow", " Close "))